@@ -2,42 +2,154 @@
 EDI X12 to JSON Converter for Insurance Industry
 """
 
+import concurrent.futures
 import json
+import os
+import re
 import time
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from .io_utils import read_many
 from .x12_parser import X12Parser
 from .models import (
     TransactionType, EDIConversionRequest, EDIConversionResponse,
     Claim837, Remittance835, Enrollment834, Provider, Patient, Address,
-    Diagnosis, Procedure, ClaimLine, RemittanceLine, EnrollmentMember
+    Diagnosis, Procedure, ClaimLine, RemittanceLine, EnrollmentMember,
+    _TX_BY_CODE
 )
 
+# Matches the required envelope/transaction segment IDs at segment starts so a
+# single pass over the content can check for all of them at once
+_REQUIRED_SEG_RE = re.compile(r'(?:\A|[~\r\n])\s*(ISA|IEA|ST|SE)[*~]')
+_SEG_BITS = {'ISA': 1, 'IEA': 2, 'ST': 4, 'SE': 8}
+_ALL_SEG_BITS = 0b1111
+
+_VALIDATION_PREFIX = "X12 validation failed: "
+
+
+def _lstrip_offset(content: str) -> int:
+    """Index of the first non-whitespace character, without copying content"""
+    offset = 0
+    content_length = len(content)
+    while offset < content_length and content[offset] in ' \t\r\n':
+        offset += 1
+    return offset
+
+# Shared empty-dict default for absent sub-records; must never be mutated
+_EMPTY: Dict[str, Any] = {}
+
+_META_VERSION = "1.0"
+
+
+def _iso(value: Optional[Any]) -> Optional[str]:
+    """Render a date/datetime as an ISO string, passing None through"""
+    return value.isoformat() if value is not None else None
+
+# Pre-sized output skeletons holding the static fields for each transaction
+# type; copied per conversion so the hash table is allocated once at the
+# right size instead of rebuilt key-by-key from a literal
+_SKEL_837 = {
+    "transaction_type": "837",
+    "transaction_name": "Health Care Claim",
+    "control_number": '',
+    "submission_date": None,
+    "provider": None,
+    "patient": None,
+    "diagnoses": None,
+    "claim_lines": None,
+    "total_charge_amount": None,
+    "metadata": None,
+}
+
+_SKEL_835 = {
+    "transaction_type": "835",
+    "transaction_name": "Health Care Claim Payment/Advice",
+    "control_number": '',
+    "creation_date": None,
+    "payer": None,
+    "provider": None,
+    "total_paid_amount": None,
+    "remittance_lines": None,
+    "metadata": None,
+}
+
+_SKEL_834 = {
+    "transaction_type": "834",
+    "transaction_name": "Benefit Enrollment and Maintenance",
+    "control_number": '',
+    "creation_date": None,
+    "sponsor": None,
+    "members": None,
+    "member_count": 0,
+    "metadata": None,
+}
+
 
 class EDIConverter:
     """Main converter class for EDI X12 to JSON transformations"""
     
     def __init__(self):
         self.parser = X12Parser()
-    
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    def convert_many(self, requests: List[EDIConversionRequest]) -> List[EDIConversionResponse]:
+        """Convert a batch of requests, fanning out across CPU cores
+
+        Parsing is GIL-bound pure Python, so bulk jobs gain close to a core's
+        worth of throughput per worker. Small batches stay in-process to
+        avoid pool startup and pickling overhead.
+        """
+        if len(requests) <= 1:
+            return [self.convert_to_json(request) for request in requests]
+
+        if self._pool is None:
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count()
+            )
+        return list(self._pool.map(_convert_one, requests))
+
+    def convert_directory(self, directory: str,
+                          pattern: str = "*.txt") -> List[EDIConversionResponse]:
+        """Convert every matching file in a directory as one batch
+
+        Files are read concurrently (see io_utils.read_many) and then
+        converted through convert_many, so both the I/O and the parsing
+        fan out.
+        """
+        paths = sorted(Path(directory).glob(pattern))
+        requests = [
+            EDIConversionRequest(x12_content=content.decode('ascii', 'replace'))
+            for content in read_many(paths)
+        ]
+        return self.convert_many(requests)
+
+
     def convert_to_json(self, request: EDIConversionRequest) -> EDIConversionResponse:
         """Convert X12 EDI content to JSON format"""
-        start_time = time.time()
-        
+        # perf_counter is monotonic and much cheaper than the wall-clock
+        # time.time() for measuring elapsed time
+        start_time = time.perf_counter()
+
         try:
-            # Validate X12 content if requested
+            # Parse X12 content; validation results are collected during the
+            # same pass so the payload is not scanned twice
+            parsed_data = self.parser.parse_x12(
+                request.x12_content,
+                collect_validation=request.validate_content,
+                known_type=request.transaction_type
+            )
+
             if request.validate_content:
-                validation_result = self.validate_x12(request.x12_content)
+                validation_result = parsed_data.pop('_validation')
                 if not validation_result["valid"]:
+                    errors = validation_result["errors"]
                     return EDIConversionResponse(
                         success=False,
-                        error_message="X12 validation failed: " + "; ".join(validation_result["errors"]),
-                        validation_errors=validation_result["errors"],
-                        processing_time_ms=(time.time() - start_time) * 1000
+                        error_message=_VALIDATION_PREFIX + "; ".join(errors),
+                        validation_errors=errors,
+                        processing_time_ms=(time.perf_counter() - start_time) * 1000
                     )
             
-            # Parse X12 content
-            parsed_data = self.parser.parse_x12(request.x12_content)
-            
             # Convert to structured JSON based on transaction type
             transaction_type = parsed_data.get('transaction_type', '837')
             
@@ -50,17 +162,17 @@ class EDIConverter:
             else:
                 json_data = self._convert_generic_to_json(parsed_data)
             
-            processing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+            processing_time = (time.perf_counter() - start_time) * 1000  # Convert to milliseconds
             
             return EDIConversionResponse(
                 success=True,
-                transaction_type=TransactionType(transaction_type),
+                transaction_type=_TX_BY_CODE.get(transaction_type),
                 json_data=json_data,
                 processing_time_ms=processing_time
             )
             
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
             return EDIConversionResponse(
                 success=False,
                 error_message=str(e),
@@ -69,116 +181,150 @@ class EDIConverter:
     
     def _convert_837_to_json(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert 837 Claims data to structured JSON"""
-        return {
-            "transaction_type": "837",
-            "transaction_name": "Health Care Claim",
-            "control_number": parsed_data.get('control_number', ''),
-            "submission_date": parsed_data.get('submission_date'),
-            "provider": {
-                "npi": parsed_data.get('provider', {}).get('npi', ''),
-                "name": parsed_data.get('provider', {}).get('name', ''),
-                "first_name": parsed_data.get('provider', {}).get('first_name', ''),
-                "last_name": parsed_data.get('provider', {}).get('last_name', ''),
-                "middle_name": parsed_data.get('provider', {}).get('middle_name', '')
-            },
-            "patient": {
-                "member_id": parsed_data.get('patient', {}).get('member_id', ''),
-                "first_name": parsed_data.get('patient', {}).get('first_name', ''),
-                "last_name": parsed_data.get('patient', {}).get('last_name', ''),
-                "middle_name": parsed_data.get('patient', {}).get('middle_name', '')
-            },
-            "diagnoses": parsed_data.get('diagnoses', []),
-            "claim_lines": parsed_data.get('claim_lines', []),
-            "total_charge_amount": parsed_data.get('total_charge_amount'),
-            "metadata": {
-                "parsed_at": time.time(),
-                "version": "1.0"
-            }
+        provider = parsed_data.get('provider', _EMPTY)
+        patient = parsed_data.get('patient', _EMPTY)
+        out = _SKEL_837.copy()
+        out["control_number"] = parsed_data.get('control_number', '')
+        out["submission_date"] = _iso(parsed_data.get('submission_date'))
+        out["provider"] = {
+            "npi": provider.get('npi', ''),
+            "name": provider.get('name', ''),
+            "first_name": provider.get('first_name', ''),
+            "last_name": provider.get('last_name', ''),
+            "middle_name": provider.get('middle_name', '')
+        }
+        out["patient"] = {
+            "member_id": patient.get('member_id', ''),
+            "first_name": patient.get('first_name', ''),
+            "last_name": patient.get('last_name', ''),
+            "middle_name": patient.get('middle_name', '')
         }
+        out["diagnoses"] = parsed_data.get('diagnoses', [])
+        out["claim_lines"] = parsed_data.get('claim_lines', [])
+        out["total_charge_amount"] = parsed_data.get('total_charge_amount')
+        out["metadata"] = {
+            "parsed_at": time.time(),
+            "version": _META_VERSION
+        }
+        return out
     
     def _convert_835_to_json(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert 835 Remittance Advice data to structured JSON"""
-        return {
-            "transaction_type": "835",
-            "transaction_name": "Health Care Claim Payment/Advice",
-            "control_number": parsed_data.get('control_number', ''),
-            "creation_date": parsed_data.get('creation_date'),
-            "payer": {
-                "name": parsed_data.get('payer_name', ''),
-                "id": parsed_data.get('payer_id', '')
-            },
-            "provider": {
-                "npi": parsed_data.get('provider', {}).get('npi', ''),
-                "name": parsed_data.get('provider', {}).get('name', ''),
-                "first_name": parsed_data.get('provider', {}).get('first_name', ''),
-                "last_name": parsed_data.get('provider', {}).get('last_name', ''),
-                "middle_name": parsed_data.get('provider', {}).get('middle_name', '')
-            },
-            "total_paid_amount": parsed_data.get('total_paid_amount'),
-            "remittance_lines": parsed_data.get('remittance_lines', []),
-            "metadata": {
-                "parsed_at": time.time(),
-                "version": "1.0"
-            }
+        provider = parsed_data.get('provider', _EMPTY)
+        out = _SKEL_835.copy()
+        out["control_number"] = parsed_data.get('control_number', '')
+        out["creation_date"] = _iso(parsed_data.get('creation_date'))
+        out["payer"] = {
+            "name": parsed_data.get('payer_name', ''),
+            "id": parsed_data.get('payer_id', '')
+        }
+        out["provider"] = {
+            "npi": provider.get('npi', ''),
+            "name": provider.get('name', ''),
+            "first_name": provider.get('first_name', ''),
+            "last_name": provider.get('last_name', ''),
+            "middle_name": provider.get('middle_name', '')
         }
+        out["total_paid_amount"] = parsed_data.get('total_paid_amount')
+        out["remittance_lines"] = parsed_data.get('remittance_lines', [])
+        out["metadata"] = {
+            "parsed_at": time.time(),
+            "version": _META_VERSION
+        }
+        return out
     
     def _convert_834_to_json(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert 834 Enrollment data to structured JSON"""
-        return {
-            "transaction_type": "834",
-            "transaction_name": "Benefit Enrollment and Maintenance",
-            "control_number": parsed_data.get('control_number', ''),
-            "creation_date": parsed_data.get('creation_date'),
-            "sponsor": {
-                "name": parsed_data.get('sponsor_name', ''),
-                "id": parsed_data.get('sponsor_id', '')
-            },
-            "members": parsed_data.get('members', []),
-            "member_count": len(parsed_data.get('members', [])),
-            "metadata": {
-                "parsed_at": time.time(),
-                "version": "1.0"
+        out = _SKEL_834.copy()
+        out["control_number"] = parsed_data.get('control_number', '')
+        out["creation_date"] = _iso(parsed_data.get('creation_date'))
+        out["sponsor"] = {
+            "name": parsed_data.get('sponsor_name', ''),
+            "id": parsed_data.get('sponsor_id', '')
+        }
+        # Member records carry date objects from the parser; render them once
+        # here so the serializer never falls back to a per-value callback
+        members = [
+            {
+                **member,
+                "date_of_birth": _iso(member.get('date_of_birth')),
+                "effective_date": _iso(member.get('effective_date'))
             }
+            for member in parsed_data.get('members', [])
+        ]
+        out["members"] = members
+        out["member_count"] = len(members)
+        out["metadata"] = {
+            "parsed_at": time.time(),
+            "version": _META_VERSION
         }
+        return out
     
     def _convert_generic_to_json(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert generic X12 data to structured JSON"""
+        # The parser returns a lazy SegmentView; materialize it here since
+        # the JSON boundary serializes every record anyway
+        segments = list(parsed_data.get('segments') or [])
         return {
             "transaction_type": parsed_data.get('transaction_type', 'unknown'),
-            "segments": parsed_data.get('segments', []),
-            "segment_count": len(parsed_data.get('segments', [])),
+            "segments": segments,
+            "segment_count": len(segments),
             "metadata": {
                 "parsed_at": time.time(),
-                "version": "1.0"
+                "version": _META_VERSION
             }
         }
     
     def validate_x12(self, x12_content: str) -> Dict[str, Any]:
         """Validate X12 content structure"""
         validation_errors = []
-        
-        # Basic X12 structure validation
-        if not x12_content.strip():
+
+        # Find the first non-whitespace character without copying the payload
+        offset = _lstrip_offset(x12_content)
+        if offset >= len(x12_content):
             validation_errors.append("Empty X12 content")
             return {"valid": False, "errors": validation_errors}
-        
+
+        # Rule segments out with plain substring scans first; `in` runs on
+        # CPython's memchr-backed fast path, so obviously malformed payloads
+        # never reach the regex pass at all
+        candidates = 0
+        for segment_id, bit in _SEG_BITS.items():
+            if segment_id in x12_content:
+                candidates |= bit
+
+        # Single pass over the content confirming the candidates actually
+        # appear at segment boundaries, stopping once every one is seen
+        found = 0
+        if candidates:
+            for match in _REQUIRED_SEG_RE.finditer(x12_content, offset):
+                found |= _SEG_BITS[match.group(1)]
+                if found == candidates:
+                    break
+
         # Check for ISA segment
-        if not x12_content.strip().startswith('ISA'):
+        if not x12_content.startswith('ISA', offset):
             validation_errors.append("Missing ISA segment")
-        
+
         # Check for IEA segment
-        if 'IEA' not in x12_content:
+        if not found & _SEG_BITS['IEA']:
             validation_errors.append("Missing IEA segment")
-        
+
         # Check for ST segment
-        if 'ST' not in x12_content:
+        if not found & _SEG_BITS['ST']:
             validation_errors.append("Missing ST segment")
-        
+
         # Check for SE segment
-        if 'SE' not in x12_content:
+        if not found & _SEG_BITS['SE']:
             validation_errors.append("Missing SE segment")
-        
+
         return {
             "valid": len(validation_errors) == 0,
             "errors": validation_errors
         }
+
+
+def _convert_one(request: EDIConversionRequest) -> EDIConversionResponse:
+    """Worker entry point for convert_many; builds its own converter so only
+    the request needs to cross the process boundary"""
+    return EDIConverter().convert_to_json(request)
@@ -0,0 +1,28 @@
+"""
+Bulk file reading helpers for batch EDI ingestion
+"""
+
+import concurrent.futures
+from pathlib import Path
+from typing import Iterable, List, Union
+
+# EDI files are small (1-100KB), so per-file syscall latency dominates a
+# sequential read loop; reads overlap in a thread pool since file I/O
+# releases the GIL. Capped so huge directories don't spawn huge pools.
+_MAX_READ_WORKERS = 32
+
+
+def _read_one(path: Union[str, Path]) -> bytes:
+    with open(path, 'rb') as handle:
+        return handle.read()
+
+
+def read_many(paths: Iterable[Union[str, Path]]) -> List[bytes]:
+    """Read many small files concurrently, preserving input order"""
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [_read_one(path) for path in paths]
+
+    workers = min(len(paths), _MAX_READ_WORKERS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_read_one, paths))
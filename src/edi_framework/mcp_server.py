@@ -5,6 +5,11 @@ MCP Server for EDI X12 to JSON Conversion
 import asyncio
 import json
 from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -15,15 +20,215 @@ from mcp.types import (
 )
 
 from .converter import EDIConverter
-from .models import EDIConversionRequest, TransactionType
+from .models import EDIConversionRequest, TransactionType, _TX_BY_CODE
+
+
+def _build_list_tools_result() -> ListToolsResult:
+    """Build the static tool listing advertised by the server"""
+    return ListToolsResult(
+        tools=[
+            Tool(
+                name="convert_x12_to_json",
+                description="Convert X12 EDI content to JSON format for insurance industry transactions",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "x12_content": {
+                            "type": "string",
+                            "description": "Raw X12 EDI content to convert"
+                        },
+                        "transaction_type": {
+                            "type": "string",
+                            "enum": ["837", "835", "834", "270", "271", "276", "277"],
+                            "description": "Expected transaction type (optional, will auto-detect if not provided)"
+                        },
+                        "validate": {
+                            "type": "boolean",
+                            "description": "Whether to validate the X12 content structure",
+                            "default": True
+                        }
+                    },
+                    "required": ["x12_content"]
+                }
+            ),
+            Tool(
+                name="convert_x12_batch",
+                description="Convert multiple X12 EDI documents to JSON in a single call, in parallel",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "x12_contents": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Raw X12 EDI documents to convert"
+                        },
+                        "validate": {
+                            "type": "boolean",
+                            "description": "Whether to validate each X12 document's structure",
+                            "default": True
+                        }
+                    },
+                    "required": ["x12_contents"]
+                }
+            ),
+            Tool(
+                name="validate_x12",
+                description="Validate X12 EDI content structure and format",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "x12_content": {
+                            "type": "string",
+                            "description": "Raw X12 EDI content to validate"
+                        }
+                    },
+                    "required": ["x12_content"]
+                }
+            ),
+            Tool(
+                name="get_supported_transactions",
+                description="Get list of supported EDI transaction types",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
+            ),
+            Tool(
+                name="convert_837_claims",
+                description="Convert 837 Health Care Claim transaction to JSON",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "x12_content": {
+                            "type": "string",
+                            "description": "Raw X12 837 EDI content"
+                        }
+                    },
+                    "required": ["x12_content"]
+                }
+            ),
+            Tool(
+                name="convert_835_remittance",
+                description="Convert 835 Health Care Claim Payment/Advice transaction to JSON",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "x12_content": {
+                            "type": "string",
+                            "description": "Raw X12 835 EDI content"
+                        }
+                    },
+                    "required": ["x12_content"]
+                }
+            ),
+            Tool(
+                name="convert_834_enrollment",
+                description="Convert 834 Benefit Enrollment and Maintenance transaction to JSON",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "x12_content": {
+                            "type": "string",
+                            "description": "Raw X12 834 EDI content"
+                        }
+                    },
+                    "required": ["x12_content"]
+                }
+            )
+        ]
+    )
+
+
+def _build_supported_transactions_text() -> str:
+    """Build the static supported-transactions listing"""
+    transactions = [
+        {
+            "code": "837",
+            "name": "Health Care Claim",
+            "description": "Professional and institutional claims submission"
+        },
+        {
+            "code": "835",
+            "name": "Health Care Claim Payment/Advice",
+            "description": "Remittance advice and payment information"
+        },
+        {
+            "code": "834",
+            "name": "Benefit Enrollment and Maintenance",
+            "description": "Member enrollment and benefit maintenance"
+        },
+        {
+            "code": "270",
+            "name": "Health Care Eligibility/Benefit Inquiry",
+            "description": "Eligibility verification request"
+        },
+        {
+            "code": "271",
+            "name": "Health Care Eligibility/Benefit Response",
+            "description": "Eligibility verification response"
+        },
+        {
+            "code": "276",
+            "name": "Health Care Claim Status Request",
+            "description": "Claim status inquiry"
+        },
+        {
+            "code": "277",
+            "name": "Health Care Claim Status Response",
+            "description": "Claim status response"
+        }
+    ]
+
+    result_text = "📋 Supported EDI Transaction Types\n\n"
+    for tx in transactions:
+        result_text += f"**{tx['code']} - {tx['name']}**\n"
+        result_text += f"{tx['description']}\n\n"
+    return result_text
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize conversion output to indented JSON, using orjson when available
+
+    The converter renders dates as ISO strings up front, so no per-value
+    default callback is needed here and the encoder stays on its C fast path.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+# Maximum number of queued tool calls processed per worker wakeup
+MAX_BATCH = 32
+
+# Serialized JSON larger than this is split across multiple TextContent
+# entries instead of being concatenated into one giant string
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# Tools that are plain convert_x12_to_json calls with a forced type
+_TX_FORCED = {
+    "convert_837_claims": "837",
+    "convert_835_remittance": "835",
+    "convert_834_enrollment": "834",
+}
 
 
 class EDIMCPServer:
     """MCP Server for EDI X12 to JSON conversion"""
-    
+
     def __init__(self):
         self.server = Server("edi-converter")
         self.converter = EDIConverter()
+        self._call_queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        # The tool listing and supported-transactions results are static;
+        # build them once instead of reconstructing the models per RPC
+        self._cached_list_tools = _build_list_tools_result()
+        self._supported_tx_result = CallToolResult(
+            content=[TextContent(
+                type="text",
+                text=_build_supported_transactions_text()
+            )]
+        )
         self._setup_handlers()
     
     def _setup_handlers(self):
@@ -32,123 +237,13 @@ class EDIMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> ListToolsResult:
             """List available EDI conversion tools"""
-            return ListToolsResult(
-                tools=[
-                    Tool(
-                        name="convert_x12_to_json",
-                        description="Convert X12 EDI content to JSON format for insurance industry transactions",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "x12_content": {
-                                    "type": "string",
-                                    "description": "Raw X12 EDI content to convert"
-                                },
-                                "transaction_type": {
-                                    "type": "string",
-                                    "enum": ["837", "835", "834", "270", "271", "276", "277"],
-                                    "description": "Expected transaction type (optional, will auto-detect if not provided)"
-                                },
-                                "validate": {
-                                    "type": "boolean",
-                                    "description": "Whether to validate the X12 content structure",
-                                    "default": True
-                                }
-                            },
-                            "required": ["x12_content"]
-                        }
-                    ),
-                    Tool(
-                        name="validate_x12",
-                        description="Validate X12 EDI content structure and format",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "x12_content": {
-                                    "type": "string",
-                                    "description": "Raw X12 EDI content to validate"
-                                }
-                            },
-                            "required": ["x12_content"]
-                        }
-                    ),
-                    Tool(
-                        name="get_supported_transactions",
-                        description="Get list of supported EDI transaction types",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {}
-                        }
-                    ),
-                    Tool(
-                        name="convert_837_claims",
-                        description="Convert 837 Health Care Claim transaction to JSON",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "x12_content": {
-                                    "type": "string",
-                                    "description": "Raw X12 837 EDI content"
-                                }
-                            },
-                            "required": ["x12_content"]
-                        }
-                    ),
-                    Tool(
-                        name="convert_835_remittance",
-                        description="Convert 835 Health Care Claim Payment/Advice transaction to JSON",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "x12_content": {
-                                    "type": "string",
-                                    "description": "Raw X12 835 EDI content"
-                                }
-                            },
-                            "required": ["x12_content"]
-                        }
-                    ),
-                    Tool(
-                        name="convert_834_enrollment",
-                        description="Convert 834 Benefit Enrollment and Maintenance transaction to JSON",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "x12_content": {
-                                    "type": "string",
-                                    "description": "Raw X12 834 EDI content"
-                                }
-                            },
-                            "required": ["x12_content"]
-                        }
-                    )
-                ]
-            )
+            return self._cached_list_tools
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
             """Handle tool calls"""
             try:
-                if name == "convert_x12_to_json":
-                    return await self._handle_convert_x12_to_json(arguments)
-                elif name == "validate_x12":
-                    return await self._handle_validate_x12(arguments)
-                elif name == "get_supported_transactions":
-                    return await self._handle_get_supported_transactions()
-                elif name == "convert_837_claims":
-                    return await self._handle_convert_837_claims(arguments)
-                elif name == "convert_835_remittance":
-                    return await self._handle_convert_835_remittance(arguments)
-                elif name == "convert_834_enrollment":
-                    return await self._handle_convert_834_enrollment(arguments)
-                else:
-                    return CallToolResult(
-                        content=[TextContent(
-                            type="text",
-                            text=f"Unknown tool: {name}"
-                        )],
-                        isError=True
-                    )
+                return await self._enqueue_call(name, arguments)
             except Exception as e:
                 return CallToolResult(
                     content=[TextContent(
@@ -157,6 +252,63 @@ class EDIMCPServer:
                     )],
                     isError=True
                 )
+
+    async def _enqueue_call(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Queue a tool call for the batch worker and wait for its result"""
+        if self._call_queue is None:
+            self._call_queue = asyncio.Queue()
+            self._worker_task = asyncio.ensure_future(self._drain_calls())
+
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        await self._call_queue.put((name, arguments, future))
+        return await future
+
+    async def _drain_calls(self):
+        """Drain queued tool calls in batches so pipelined requests amortize
+        event-loop wakeups instead of serializing one call per wakeup"""
+        while True:
+            batch = [await self._call_queue.get()]
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._call_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            results = await asyncio.gather(
+                *(self._dispatch_call(name, arguments) for name, arguments, _ in batch),
+                return_exceptions=True
+            )
+            for (_, _, future), result in zip(batch, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _dispatch_call(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Dispatch a single tool call to its handler"""
+        forced_type = _TX_FORCED.get(name)
+        if forced_type is not None:
+            arguments = {**arguments, "transaction_type": forced_type}
+            name = "convert_x12_to_json"
+
+        if name == "convert_x12_to_json":
+            return await self._handle_convert_x12_to_json(arguments)
+        elif name == "convert_x12_batch":
+            return await self._handle_convert_x12_batch(arguments)
+        elif name == "validate_x12":
+            return await self._handle_validate_x12(arguments)
+        elif name == "get_supported_transactions":
+            return await self._handle_get_supported_transactions()
+        else:
+            return CallToolResult(
+                content=[TextContent(
+                    type="text",
+                    text=f"Unknown tool: {name}"
+                )],
+                isError=True
+            )
     
     async def _handle_convert_x12_to_json(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Handle X12 to JSON conversion"""
@@ -176,27 +328,40 @@ class EDIMCPServer:
         # Create conversion request
         request = EDIConversionRequest(
             x12_content=x12_content,
-            transaction_type=TransactionType(transaction_type) if transaction_type else None,
+            transaction_type=_TX_BY_CODE.get(transaction_type) if transaction_type else None,
             validate=validate
         )
         
-        # Perform conversion
-        response = self.converter.convert_to_json(request)
+        # Perform conversion in a worker thread; a large parse would otherwise
+        # block every other in-flight tool call on the event loop
+        response = await asyncio.to_thread(self.converter.convert_to_json, request)
         
         if response.success:
-            result_text = f"""✅ EDI Conversion Successful
+            header = f"""✅ EDI Conversion Successful
 
 Transaction Type: {response.transaction_type.value if response.transaction_type else 'Auto-detected'}
 Processing Time: {response.processing_time_ms:.2f}ms
 
 JSON Output:
-{json.dumps(response.json_data, indent=2, default=str)}"""
-        else:
-            result_text = f"""❌ EDI Conversion Failed
+"""
+            json_text = _dumps_indented(response.json_data)
+            if len(json_text) <= RESPONSE_CHUNK_SIZE:
+                content = [TextContent(type="text", text=header + json_text)]
+            else:
+                # Chunk large payloads so we never concatenate the header and
+                # a multi-MB JSON string into yet another full-size copy
+                content = [TextContent(type="text", text=header)]
+                content.extend(
+                    TextContent(type="text", text=json_text[i:i + RESPONSE_CHUNK_SIZE])
+                    for i in range(0, len(json_text), RESPONSE_CHUNK_SIZE)
+                )
+            return CallToolResult(content=content)
+
+        result_text = f"""❌ EDI Conversion Failed
 
 Error: {response.error_message}
 Processing Time: {response.processing_time_ms:.2f}ms"""
-        
+
         return CallToolResult(
             content=[TextContent(
                 type="text",
@@ -204,6 +369,42 @@ Processing Time: {response.processing_time_ms:.2f}ms"""
             )]
         )
     
+    async def _handle_convert_x12_batch(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Handle bulk X12 to JSON conversion"""
+        x12_contents = arguments.get("x12_contents") or []
+        validate = arguments.get("validate", True)
+
+        if not x12_contents:
+            return CallToolResult(
+                content=[TextContent(
+                    type="text",
+                    text="Error: x12_contents is required"
+                )],
+                isError=True
+            )
+
+        requests = [
+            EDIConversionRequest(x12_content=content, validate_content=validate)
+            for content in x12_contents
+        ]
+        responses = await asyncio.to_thread(self.converter.convert_many, requests)
+
+        parts = []
+        for index, response in enumerate(responses):
+            if response.success:
+                parts.append(
+                    f"Document {index + 1}: ✅ "
+                    f"{response.transaction_type.value if response.transaction_type else 'unknown'} "
+                    f"({response.processing_time_ms:.2f}ms)\n"
+                    f"{_dumps_indented(response.json_data)}"
+                )
+            else:
+                parts.append(f"Document {index + 1}: ❌ {response.error_message}")
+
+        return CallToolResult(
+            content=[TextContent(type="text", text="\n\n".join(parts))]
+        )
+
     async def _handle_validate_x12(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Handle X12 validation"""
         x12_content = arguments.get("x12_content", "")
@@ -234,76 +435,7 @@ Processing Time: {response.processing_time_ms:.2f}ms"""
     
     async def _handle_get_supported_transactions(self) -> CallToolResult:
         """Handle getting supported transaction types"""
-        transactions = [
-            {
-                "code": "837",
-                "name": "Health Care Claim",
-                "description": "Professional and institutional claims submission"
-            },
-            {
-                "code": "835",
-                "name": "Health Care Claim Payment/Advice",
-                "description": "Remittance advice and payment information"
-            },
-            {
-                "code": "834",
-                "name": "Benefit Enrollment and Maintenance",
-                "description": "Member enrollment and benefit maintenance"
-            },
-            {
-                "code": "270",
-                "name": "Health Care Eligibility/Benefit Inquiry",
-                "description": "Eligibility verification request"
-            },
-            {
-                "code": "271",
-                "name": "Health Care Eligibility/Benefit Response",
-                "description": "Eligibility verification response"
-            },
-            {
-                "code": "276",
-                "name": "Health Care Claim Status Request",
-                "description": "Claim status inquiry"
-            },
-            {
-                "code": "277",
-                "name": "Health Care Claim Status Response",
-                "description": "Claim status response"
-            }
-        ]
-        
-        result_text = "📋 Supported EDI Transaction Types\n\n"
-        for tx in transactions:
-            result_text += f"**{tx['code']} - {tx['name']}**\n"
-            result_text += f"{tx['description']}\n\n"
-        
-        return CallToolResult(
-            content=[TextContent(
-                type="text",
-                text=result_text
-            )]
-        )
-    
-    async def _handle_convert_837_claims(self, arguments: Dict[str, Any]) -> CallToolResult:
-        """Handle 837 claims conversion"""
-        return await self._handle_convert_x12_to_json({
-            **arguments,
-            "transaction_type": "837"
-        })
-    
-    async def _handle_convert_835_remittance(self, arguments: Dict[str, Any]) -> CallToolResult:
-        """Handle 835 remittance conversion"""
-        return await self._handle_convert_x12_to_json({
-            **arguments,
-            "transaction_type": "835"
-        })
-    
-    async def _handle_convert_834_enrollment(self, arguments: Dict[str, Any]) -> CallToolResult:
-        """Handle 834 enrollment conversion"""
-        return await self._handle_convert_x12_to_json({
-            **arguments,
-            "transaction_type": "834"
-        })
+        return self._supported_tx_result
     
     async def run(self):
         """Run the MCP server"""
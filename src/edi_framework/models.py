@@ -3,7 +3,7 @@ Pydantic models for EDI X12 transactions in the insurance industry
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime, date
 from enum import Enum
 
@@ -19,8 +19,15 @@ class TransactionType(str, Enum):
     CLAIM_STATUS_RESPONSE_277 = "277"
 
 
+# Precomputed code -> enum lookup; a plain dict get is cheaper than the
+# enum value-lookup machinery on the per-request path
+_TX_BY_CODE = {t.value: t for t in TransactionType}
+
+
 class Address(BaseModel):
     """Address information"""
+    model_config = ConfigDict(frozen=True)
+
     address_line_1: Optional[str] = None
     address_line_2: Optional[str] = None
     city: Optional[str] = None
@@ -31,6 +38,8 @@ class Address(BaseModel):
 
 class Provider(BaseModel):
     """Healthcare provider information"""
+    model_config = ConfigDict(frozen=True)
+
     npi: Optional[str] = None
     name: Optional[str] = None
     address: Optional[Address] = None
@@ -40,6 +49,8 @@ class Provider(BaseModel):
 
 class Patient(BaseModel):
     """Patient information"""
+    model_config = ConfigDict(frozen=True)
+
     member_id: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -52,6 +63,8 @@ class Patient(BaseModel):
 
 class Diagnosis(BaseModel):
     """Diagnosis information"""
+    model_config = ConfigDict(frozen=True)
+
     code: str
     description: Optional[str] = None
     present_on_admission: Optional[str] = None
@@ -59,6 +72,8 @@ class Diagnosis(BaseModel):
 
 class Procedure(BaseModel):
     """Medical procedure information"""
+    model_config = ConfigDict(frozen=True)
+
     code: str
     description: Optional[str] = None
     modifier: Optional[str] = None
@@ -69,6 +84,8 @@ class Procedure(BaseModel):
 
 class ClaimLine(BaseModel):
     """Individual claim line item"""
+    model_config = ConfigDict(frozen=True)
+
     line_number: int
     procedure: Procedure
     diagnosis_codes: List[str] = []
@@ -93,6 +110,8 @@ class Claim837(BaseModel):
 
 class RemittanceLine(BaseModel):
     """835 Remittance advice line item"""
+    model_config = ConfigDict(frozen=True)
+
     claim_control_number: str
     line_number: Optional[int] = None
     procedure_code: Optional[str] = None
@@ -115,6 +134,8 @@ class Remittance835(BaseModel):
 
 class EnrollmentMember(BaseModel):
     """834 Enrollment member information"""
+    model_config = ConfigDict(frozen=True)
+
     member_id: str
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -138,6 +159,14 @@ class Enrollment834(BaseModel):
 
 class EDIConversionRequest(BaseModel):
     """Request model for EDI conversion"""
+    # x12_content can be multi-MB and is passed straight to the parser, so
+    # skip whitespace stripping and assignment re-validation
+    model_config = ConfigDict(
+        str_strip_whitespace=False,
+        validate_assignment=False,
+        extra='ignore',
+    )
+
     x12_content: str = Field(..., description="Raw X12 EDI content to convert")
     transaction_type: Optional[TransactionType] = Field(None, description="Expected transaction type")
     validate_content: bool = Field(True, description="Whether to validate the X12 content")
@@ -145,6 +174,8 @@ class EDIConversionRequest(BaseModel):
 
 class EDIConversionResponse(BaseModel):
     """Response model for EDI conversion"""
+    model_config = ConfigDict(validate_assignment=False, extra='ignore')
+
     success: bool
     transaction_type: Optional[TransactionType] = None
     json_data: Optional[Dict[str, Any]] = None
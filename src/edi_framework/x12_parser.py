@@ -2,8 +2,12 @@
 X12 EDI Parser for Insurance Industry Transactions
 """
 
+import functools
 import re
-from typing import Dict, List, Optional, Tuple, Any
+import sys
+import types
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime, date
 from .models import (
     TransactionType, Claim837, Remittance835, Enrollment834,
@@ -12,51 +16,193 @@ from .models import (
 )
 
 
+# ISA header at the start of a line, bounded by the segment terminator
+_ISA_RE = re.compile(r'^ISA[^~\r\n]*', re.M)
+
+# Strips currency formatting from amounts that float() rejects outright
+_AMOUNT_CLEAN_RE = re.compile(r'[^\d.-]')
+
+# ICD-10/ICD-9 diagnosis qualifiers accepted in HI qualifier/code pairs
+_DIAG_QUALIFIERS = frozenset({'ABK', 'ABF', 'BK', 'BF', 'APR', 'BR'})
+
+# Pre-intern the segment IDs and NM1 qualifiers the handlers compare
+# against, so interned segment strings match by identity
+for _code in ('ISA', 'IEA', 'ST', 'SE', 'BHT', 'NM1', 'CLM', 'HI', 'SV2',
+              'BPR', 'BGN', 'INS', '41', 'QC', '85', '38'):
+    sys.intern(_code)
+del _code
+
+
+# ST01 code -> transaction type; one hash lookup instead of a ladder of
+# string compares, and new codes only need a new entry here
+_TXN_MAP = {
+    '837': TransactionType.CLAIMS_837,
+    '835': TransactionType.REMITTANCE_835,
+    '834': TransactionType.ENROLLMENT_834,
+    '270': TransactionType.ELIGIBILITY_270,
+    '271': TransactionType.ELIGIBILITY_RESPONSE_271,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _st_pattern(element_delimiter: str) -> "re.Pattern":
+    """Compiled ST-header pattern for a given element delimiter"""
+    delim = re.escape(element_delimiter)
+    return re.compile(r'(?:\A|[~\r\n])\s*ST' + delim + r'(\d{3})')
+
+
+@functools.lru_cache(maxsize=8)
+def _segment_pattern(segment_delimiter: str) -> "re.Pattern":
+    """Compiled run-of-segment-chars pattern for a given terminator
+
+    Newlines are in the stop set so inter-segment line breaks never end
+    up inside a match.
+    """
+    return re.compile(r'[^' + re.escape(segment_delimiter) + r'\r\n]+')
+
+
+class SegmentView(Sequence):
+    """Lazy sequence of generic segment records
+
+    Unknown-type payloads often only have their segment count and a
+    couple of entries inspected, so records are built from the raw
+    segment on first access and memoized instead of materializing a
+    dict for every segment up front. Callers that hand the whole thing
+    to a serializer should list() it first.
+    """
+
+    __slots__ = ('_segments', '_delimiter', '_records')
+
+    def __init__(self, segments: List[str], delimiter: str):
+        self._segments = segments
+        self._delimiter = delimiter
+        self._records: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._segments)))]
+        record = self._records.get(index)
+        if record is None:
+            elements = self._segments[index].split(self._delimiter)
+            record = {
+                'segment_id': elements[0] if elements else '',
+                'elements': elements[1:] if len(elements) > 1 else []
+            }
+            self._records[index] = record
+        return record
+
+
 class X12Parser:
     """Parser for X12 EDI transactions"""
-    
+
     def __init__(self):
         self.segment_delimiter = '~'
         self.element_delimiter = '*'
         self.sub_element_delimiter = ':'
         
-    def parse_x12(self, x12_content: str) -> Dict[str, Any]:
-        """Parse X12 content and return structured data"""
+    def parse_x12(self, x12_content: str, collect_validation: bool = False,
+                  known_type: Optional[TransactionType] = None) -> Dict[str, Any]:
+        """Parse X12 content and return structured data
+
+        When ``collect_validation`` is set, structural validation results are
+        gathered from the segments already in hand and returned under the
+        ``_validation`` key, so callers that validate and parse do not scan
+        the content twice.
+
+        Callers that already know the transaction type (e.g. from the
+        conversion request) can pass ``known_type`` to skip the ST-header
+        scan entirely.
+
+        Results for repeat payloads (retries, dedupe passes) come from an
+        LRU cache; a shallow copy is returned, so callers may add or remove
+        top-level keys but must not mutate the nested structures.
+
+        Raw ``bytes`` payloads (files read in binary mode, network bodies)
+        are accepted and decoded exactly once here; everything downstream
+        stays on ASCII-kind str, whose split/find paths are already
+        memchr-backed.
+        """
+        if isinstance(x12_content, bytes):
+            x12_content = x12_content.decode('ascii', 'replace')
+        return dict(_parse_x12_cached(x12_content, collect_validation, known_type))
+
+    def _parse_impl(self, x12_content: str, collect_validation: bool,
+                    known_type: Optional[TransactionType] = None) -> Dict[str, Any]:
+        """Uncached parse of a single payload"""
         # Clean and normalize X12 content
         x12_content = x12_content.strip()
-        
+
         # Extract ISA header to get delimiters
         isa_segment = self._extract_isa_segment(x12_content)
         if isa_segment:
             self._update_delimiters(isa_segment)
-        
-        # Split into segments
-        segments = self._split_segments(x12_content)
-        
-        # Determine transaction type
-        transaction_type = self._determine_transaction_type(segments)
-        
-        # Parse based on transaction type
-        if transaction_type == TransactionType.CLAIMS_837:
-            return self._parse_837(segments)
-        elif transaction_type == TransactionType.REMITTANCE_835:
-            return self._parse_835(segments)
-        elif transaction_type == TransactionType.ENROLLMENT_834:
-            return self._parse_834(segments)
+
+        # Determine transaction type, trusting the caller when it is known
+        transaction_type = known_type or self._determine_transaction_type(x12_content)
+
+        # Stream segments straight into the per-type parser; a segment list
+        # is only materialized when validation needs a second look at it
+        if collect_validation:
+            segments = self._split_segments(x12_content)
+            source: Any = segments
         else:
-            return self._parse_generic(segments)
+            source = self._iter_segments(x12_content)
+
+        # Parse based on transaction type
+        parse = _PARSERS.get(transaction_type, X12Parser._parse_generic)
+        result = parse(self, source)
+
+        if collect_validation:
+            result['_validation'] = self._validate_segments(segments)
+
+        return result
+
+    def _validate_segments(self, segments: List[str]) -> Dict[str, Any]:
+        """Check the already-split segments for the required envelope structure"""
+        errors = []
+
+        if not segments:
+            errors.append("Empty X12 content")
+            return {"valid": False, "errors": errors}
+
+        if not segments[0].startswith('ISA'):
+            errors.append("Missing ISA segment")
+
+        found_iea = found_st = found_se = False
+        for segment in segments:
+            if segment.startswith('IEA'):
+                found_iea = True
+            elif segment.startswith('ST'):
+                found_st = True
+            elif segment.startswith('SE'):
+                found_se = True
+
+        if not found_iea:
+            errors.append("Missing IEA segment")
+        if not found_st:
+            errors.append("Missing ST segment")
+        if not found_se:
+            errors.append("Missing SE segment")
+
+        return {"valid": len(errors) == 0, "errors": errors}
     
     def _extract_isa_segment(self, x12_content: str) -> Optional[str]:
         """Extract ISA segment from X12 content"""
-        lines = x12_content.split('\n')
-        for line in lines:
-            if line.startswith('ISA'):
-                return line.strip()
-        return None
+        match = _ISA_RE.search(x12_content)
+        return match.group(0) if match else None
     
     def _update_delimiters(self, isa_segment: str):
-        """Update delimiters based on ISA segment"""
-        elements = isa_segment.split(self.element_delimiter)
+        """Update delimiters based on ISA segment
+
+        The spec makes ISA fixed-width, but real-world feeds pad or trim
+        header fields, so fixed character offsets cannot be trusted; the
+        split is instead bounded at 16 so scanning stops at the element
+        that carries the delimiter information.
+        """
+        elements = isa_segment.split(self.element_delimiter, 16)
         if len(elements) >= 16:
             # The 16th element contains the delimiter information
             delimiter_info = elements[15]
@@ -65,32 +211,41 @@ class X12Parser:
                 self.sub_element_delimiter = delimiter_info[1]
     
     def _split_segments(self, x12_content: str) -> List[str]:
-        """Split X12 content into segments"""
-        # Remove newlines and split by segment delimiter
-        content = x12_content.replace('\n', '').replace('\r', '')
-        segments = content.split(self.segment_delimiter)
-        return [seg for seg in segments if seg.strip()]
+        """Split X12 content into a list of segments
+
+        When the whole list is wanted anyway, one findall in the regex
+        engine's C loop beats driving the generator from Python.
+        """
+        pattern = _segment_pattern(self.segment_delimiter)
+        return [s for s in map(str.strip, pattern.findall(x12_content)) if s]
+
+    def _iter_segments(self, x12_content: str) -> Iterator[str]:
+        """Yield non-empty segments one at a time
+
+        str.find is memchr-backed, so this walks the payload once without
+        the full-copy replace() passes or the all-segments list the old
+        split-based approach allocated.
+        """
+        delimiter = self.segment_delimiter
+        start = 0
+        content_length = len(x12_content)
+        while start < content_length:
+            end = x12_content.find(delimiter, start)
+            if end < 0:
+                end = content_length
+            segment = x12_content[start:end].strip()
+            if segment:
+                yield segment
+            start = end + 1
     
-    def _determine_transaction_type(self, segments: List[str]) -> TransactionType:
-        """Determine transaction type from segments"""
-        for segment in segments:
-            if segment.startswith('ST'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 2:
-                    st01 = elements[1]
-                    if st01 == '837':
-                        return TransactionType.CLAIMS_837
-                    elif st01 == '835':
-                        return TransactionType.REMITTANCE_835
-                    elif st01 == '834':
-                        return TransactionType.ENROLLMENT_834
-                    elif st01 == '270':
-                        return TransactionType.ELIGIBILITY_270
-                    elif st01 == '271':
-                        return TransactionType.ELIGIBILITY_RESPONSE_271
+    def _determine_transaction_type(self, x12_content: str) -> TransactionType:
+        """Determine transaction type from the ST header"""
+        match = _st_pattern(self.element_delimiter).search(x12_content)
+        if match:
+            return _TXN_MAP.get(match.group(1), TransactionType.CLAIMS_837)
         return TransactionType.CLAIMS_837  # Default
     
-    def _parse_837(self, segments: List[str]) -> Dict[str, Any]:
+    def _parse_837(self, segments: Iterable[str]) -> Dict[str, Any]:
         """Parse 837 Claims transaction"""
         result = {
             'transaction_type': '837',
@@ -102,42 +257,29 @@ class X12Parser:
             'claim_lines': [],
             'total_charge_amount': None
         }
-        
-        for segment in segments:
-            if segment.startswith('ST'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 3:
-                    result['control_number'] = elements[2]
-            elif segment.startswith('BHT'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 4:
-                    result['submission_date'] = self._parse_date(elements[3])
-            elif segment.startswith('NM1'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 4:
-                    if elements[1] == '41':  # Provider
-                        result['provider'] = self._parse_provider_nm1(elements)
-                    elif elements[1] == 'QC':  # Patient
-                        result['patient'] = self._parse_patient_nm1(elements)
-            elif segment.startswith('CLM'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 3:
-                    result['total_charge_amount'] = self._parse_amount(elements[2])
-            elif segment.startswith('HI'):
-                elements = segment.split(self.element_delimiter)
-                result['diagnoses'].extend(self._parse_diagnosis_codes(elements))
-            elif segment.startswith('LX'):
-                # Start of claim line
-                pass
-            elif segment.startswith('SV2'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 3:
-                    claim_line = self._parse_claim_line(elements)
-                    result['claim_lines'].append(claim_line)
-        
+
+        self._dispatch_segments(segments, _DISPATCH_837, result)
         return result
+
+    def _dispatch_segments(self, segments: Iterable[str], dispatch: Dict[str, Any],
+                           result: Dict[str, Any]) -> None:
+        """Split each segment once and route it through a handler table
+
+        A single dict lookup on the already-split segment ID replaces the
+        chain of startswith prefix scans over the full segment string.
+        Segment IDs are interned so the lookup hits on pointer identity
+        rather than a character compare.
+        """
+        delimiter = self.element_delimiter
+        get_handler = dispatch.get
+        intern = sys.intern
+        for segment in segments:
+            elements = segment.split(delimiter)
+            handler = get_handler(intern(elements[0]))
+            if handler is not None:
+                handler(self, elements, result)
     
-    def _parse_835(self, segments: List[str]) -> Dict[str, Any]:
+    def _parse_835(self, segments: Iterable[str]) -> Dict[str, Any]:
         """Parse 835 Remittance Advice transaction"""
         result = {
             'transaction_type': '835',
@@ -149,28 +291,11 @@ class X12Parser:
             'total_paid_amount': None,
             'remittance_lines': []
         }
-        
-        for segment in segments:
-            if segment.startswith('ST'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 3:
-                    result['control_number'] = elements[2]
-            elif segment.startswith('BPR'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 3:
-                    result['total_paid_amount'] = self._parse_amount(elements[2])
-            elif segment.startswith('NM1'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 4:
-                    if elements[1] == '41':  # Payer
-                        result['payer_name'] = elements[3] if len(elements) > 3 else ''
-                        result['payer_id'] = elements[9] if len(elements) > 9 else ''
-                    elif elements[1] == '85':  # Provider
-                        result['provider'] = self._parse_provider_nm1(elements)
-        
+
+        self._dispatch_segments(segments, _DISPATCH_835, result)
         return result
-    
-    def _parse_834(self, segments: List[str]) -> Dict[str, Any]:
+
+    def _parse_834(self, segments: Iterable[str]) -> Dict[str, Any]:
         """Parse 834 Enrollment transaction"""
         result = {
             'transaction_type': '834',
@@ -180,74 +305,49 @@ class X12Parser:
             'sponsor_id': '',
             'members': []
         }
-        
-        for segment in segments:
-            if segment.startswith('ST'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 3:
-                    result['control_number'] = elements[2]
-            elif segment.startswith('BGN'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 3:
-                    result['creation_date'] = self._parse_date(elements[2])
-            elif segment.startswith('NM1'):
-                elements = segment.split(self.element_delimiter)
-                if len(elements) >= 4:
-                    if elements[1] == '38':  # Sponsor
-                        result['sponsor_name'] = elements[3] if len(elements) > 3 else ''
-                        result['sponsor_id'] = elements[9] if len(elements) > 9 else ''
-            elif segment.startswith('INS'):
-                elements = segment.split(self.element_delimiter)
-                member = self._parse_enrollment_member(elements)
-                result['members'].append(member)
-        
+
+        self._dispatch_segments(segments, _DISPATCH_834, result)
         return result
     
-    def _parse_generic(self, segments: List[str]) -> Dict[str, Any]:
+    def _parse_generic(self, segments: Iterable[str]) -> Dict[str, Any]:
         """Parse generic X12 transaction"""
-        result = {
+        if not isinstance(segments, list):
+            segments = list(segments)
+        return {
             'transaction_type': 'unknown',
-            'segments': []
+            'segments': SegmentView(segments, self.segment_delimiter)
         }
-        
-        for segment in segments:
-            elements = segment.split(self.segment_delimiter)
-            result['segments'].append({
-                'segment_id': elements[0] if elements else '',
-                'elements': elements[1:] if len(elements) > 1 else []
-            })
-        
-        return result
     
     def _parse_provider_nm1(self, elements: List[str]) -> Dict[str, Any]:
         """Parse NM1 segment for provider"""
-        return {
-            'npi': elements[9] if len(elements) > 9 else '',
-            'name': elements[3] if len(elements) > 3 else '',
-            'last_name': elements[3] if len(elements) > 3 else '',
-            'first_name': elements[4] if len(elements) > 4 else '',
-            'middle_name': elements[5] if len(elements) > 5 else ''
-        }
-    
+        return _provider_nm1_cached(
+            elements[3] if len(elements) > 3 else '',
+            elements[4] if len(elements) > 4 else '',
+            elements[5] if len(elements) > 5 else '',
+            elements[9] if len(elements) > 9 else ''
+        )
+
     def _parse_patient_nm1(self, elements: List[str]) -> Dict[str, Any]:
         """Parse NM1 segment for patient"""
-        return {
-            'member_id': elements[9] if len(elements) > 9 else '',
-            'last_name': elements[3] if len(elements) > 3 else '',
-            'first_name': elements[4] if len(elements) > 4 else '',
-            'middle_name': elements[5] if len(elements) > 5 else ''
-        }
+        return _patient_nm1_cached(
+            elements[3] if len(elements) > 3 else '',
+            elements[4] if len(elements) > 4 else '',
+            elements[5] if len(elements) > 5 else '',
+            elements[9] if len(elements) > 9 else ''
+        )
     
     def _parse_diagnosis_codes(self, elements: List[str]) -> List[Dict[str, str]]:
         """Parse diagnosis codes from HI segment"""
-        diagnoses = []
-        for i in range(1, len(elements), 2):
-            if i + 1 < len(elements):
-                diagnoses.append({
-                    'code': elements[i + 1],
-                    'description': ''
-                })
-        return diagnoses
+        # Elements after the segment ID come in (qualifier, code) pairs;
+        # zipping one iterator against itself walks them without the
+        # index arithmetic and bounds checks of a range loop. Only pairs
+        # carrying a recognized diagnosis qualifier are kept.
+        pairs = iter(elements[1:])
+        return [
+            {'code': sys.intern(code), 'description': ''}
+            for qualifier, code in zip(pairs, pairs)
+            if qualifier in _DIAG_QUALIFIERS
+        ]
     
     def _parse_claim_line(self, elements: List[str]) -> Dict[str, Any]:
         """Parse claim line from SV2 segment"""
@@ -273,26 +373,201 @@ class X12Parser:
         """Parse date string in various formats"""
         if not date_str:
             return None
-        
-        # Common X12 date formats
-        formats = ['%Y%m%d', '%Y%m', '%m%d%Y', '%d%m%Y']
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt).date()
-            except ValueError:
-                continue
-        
-        return None
+        return _parse_date_cached(date_str)
     
     def _parse_amount(self, amount_str: str) -> Optional[float]:
         """Parse amount string to float"""
         if not amount_str:
             return None
-        
+
+        # Most amounts are already clean ("250.00"); float() alone is far
+        # cheaper than running the cleanup first
+        try:
+            return float(amount_str)
+        except ValueError:
+            pass
+
         try:
             # Remove any non-numeric characters except decimal point and minus
-            cleaned = re.sub(r'[^\d.-]', '', amount_str)
-            return float(cleaned)
+            return float(_AMOUNT_CLEAN_RE.sub('', amount_str))
         except (ValueError, TypeError):
             return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _provider_nm1_cached(last_name: str, first_name: str, middle_name: str,
+                         npi: str) -> "types.MappingProxyType":
+    """Build the provider record for an NM1 element tuple, memoized
+
+    The same billing provider NM1 repeats across every claim in a batch,
+    so the record is cached; a read-only proxy is returned because the
+    cached entry is shared between results.
+    """
+    return types.MappingProxyType({
+        'npi': npi,
+        'name': last_name,
+        'last_name': last_name,
+        'first_name': first_name,
+        'middle_name': middle_name
+    })
+
+
+@functools.lru_cache(maxsize=4096)
+def _patient_nm1_cached(last_name: str, first_name: str, middle_name: str,
+                        member_id: str) -> "types.MappingProxyType":
+    """Build the patient record for an NM1 element tuple, memoized"""
+    return types.MappingProxyType({
+        'member_id': member_id,
+        'last_name': last_name,
+        'first_name': first_name,
+        'middle_name': middle_name
+    })
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[date]:
+    """Parse an X12 date by length-dispatched integer slicing
+
+    strptime costs microseconds per attempt and signals a wrong format by
+    raising, so trying a list of formats dominated the per-date cost.
+    Batch payloads also repeat the same handful of dates (submission,
+    effective, coverage dates), hence the cache.
+    """
+    if len(date_str) == 8 and date_str.isdigit():
+        # CCYYMMDD (X12 qualifier D8) is the overwhelmingly common case
+        try:
+            return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+        except ValueError:
+            pass
+        # Legacy feeds: MMDDCCYY, then DDMMCCYY
+        try:
+            return date(int(date_str[4:8]), int(date_str[:2]), int(date_str[2:4]))
+        except ValueError:
+            pass
+        try:
+            return date(int(date_str[4:8]), int(date_str[2:4]), int(date_str[:2]))
+        except ValueError:
+            return None
+    if len(date_str) == 6 and date_str.isdigit():
+        # CCYYMM
+        try:
+            return date(int(date_str[:4]), int(date_str[4:6]), 1)
+        except ValueError:
+            return None
+    return None
+
+
+def _h_st(parser, elements, result):
+    """ST: transaction set header carries the control number"""
+    if len(elements) >= 3:
+        result['control_number'] = elements[2]
+
+
+def _h_837_bht(parser, elements, result):
+    """BHT: beginning of hierarchical transaction carries the submission date"""
+    if len(elements) >= 4:
+        result['submission_date'] = parser._parse_date(elements[3])
+
+
+def _h_837_nm1(parser, elements, result):
+    """NM1: individual/organization name, qualified by NM101"""
+    if len(elements) >= 4:
+        if elements[1] == '41':  # Provider
+            result['provider'] = parser._parse_provider_nm1(elements)
+        elif elements[1] == 'QC':  # Patient
+            result['patient'] = parser._parse_patient_nm1(elements)
+
+
+def _h_837_clm(parser, elements, result):
+    """CLM: claim information carries the total charge amount"""
+    if len(elements) >= 3:
+        result['total_charge_amount'] = parser._parse_amount(elements[2])
+
+
+def _h_837_hi(parser, elements, result):
+    """HI: health care information codes (diagnoses)"""
+    result['diagnoses'].extend(parser._parse_diagnosis_codes(elements))
+
+
+def _h_837_sv2(parser, elements, result):
+    """SV2: institutional service line"""
+    if len(elements) >= 3:
+        result['claim_lines'].append(parser._parse_claim_line(elements))
+
+
+def _h_835_bpr(parser, elements, result):
+    """BPR: beginning of payment order carries the total paid amount"""
+    if len(elements) >= 3:
+        result['total_paid_amount'] = parser._parse_amount(elements[2])
+
+
+def _h_835_nm1(parser, elements, result):
+    """NM1: payer or provider name, qualified by NM101"""
+    if len(elements) >= 4:
+        if elements[1] == '41':  # Payer
+            result['payer_name'] = elements[3] if len(elements) > 3 else ''
+            result['payer_id'] = elements[9] if len(elements) > 9 else ''
+        elif elements[1] == '85':  # Provider
+            result['provider'] = parser._parse_provider_nm1(elements)
+
+
+def _h_834_bgn(parser, elements, result):
+    """BGN: beginning segment carries the creation date"""
+    if len(elements) >= 3:
+        result['creation_date'] = parser._parse_date(elements[2])
+
+
+def _h_834_nm1(parser, elements, result):
+    """NM1: sponsor name, qualified by NM101"""
+    if len(elements) >= 4:
+        if elements[1] == '38':  # Sponsor
+            result['sponsor_name'] = elements[3] if len(elements) > 3 else ''
+            result['sponsor_id'] = elements[9] if len(elements) > 9 else ''
+
+
+def _h_834_ins(parser, elements, result):
+    """INS: member-level detail"""
+    result['members'].append(parser._parse_enrollment_member(elements))
+
+
+# Segment-ID handler tables, one per transaction family
+_DISPATCH_837 = {
+    'ST': _h_st,
+    'BHT': _h_837_bht,
+    'NM1': _h_837_nm1,
+    'CLM': _h_837_clm,
+    'HI': _h_837_hi,
+    'SV2': _h_837_sv2,
+}
+
+_DISPATCH_835 = {
+    'ST': _h_st,
+    'BPR': _h_835_bpr,
+    'NM1': _h_835_nm1,
+}
+
+_DISPATCH_834 = {
+    'ST': _h_st,
+    'BGN': _h_834_bgn,
+    'NM1': _h_834_nm1,
+    'INS': _h_834_ins,
+}
+
+# Transaction type -> specialized parser; unknown types fall back to the
+# generic segment dump
+_PARSERS = {
+    TransactionType.CLAIMS_837: X12Parser._parse_837,
+    TransactionType.REMITTANCE_835: X12Parser._parse_835,
+    TransactionType.ENROLLMENT_834: X12Parser._parse_834,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_x12_cached(x12_content: str, collect_validation: bool,
+                      known_type: Optional[TransactionType]) -> Dict[str, Any]:
+    """Parse a payload on a fresh parser instance, memoizing the result
+
+    A fresh instance is used per miss so delimiter state derived from one
+    payload's ISA header can never leak into another cached entry.
+    """
+    return X12Parser()._parse_impl(x12_content, collect_validation, known_type)
@@ -97,6 +97,31 @@ class TestEDIConverter:
         assert response.success is False
         assert response.error_message is not None
 
+    def test_convert_many_mixed_batch(self):
+        """Test batch conversion across transaction types"""
+        requests = [
+            EDIConversionRequest(x12_content=self.sample_837),
+            EDIConversionRequest(x12_content=self.sample_835),
+            EDIConversionRequest(x12_content=self.sample_834),
+        ]
+
+        responses = self.converter.convert_many(requests)
+
+        assert len(responses) == 3
+        assert all(response.success for response in responses)
+        assert responses[0].transaction_type == TransactionType.CLAIMS_837
+        assert responses[1].transaction_type == TransactionType.REMITTANCE_835
+        assert responses[2].transaction_type == TransactionType.ENROLLMENT_834
+
+    def test_convert_many_single_request(self):
+        """Test that single-item batches convert in-process"""
+        responses = self.converter.convert_many(
+            [EDIConversionRequest(x12_content=self.sample_837)]
+        )
+
+        assert len(responses) == 1
+        assert responses[0].success is True
+
     def test_validate_x12_valid(self):
         """Test X12 validation with valid content"""
         validation_result = self.converter.validate_x12(self.sample_837)